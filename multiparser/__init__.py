@@ -12,25 +12,52 @@ __maintainer__ = "Kristian Zarebski"
 __email__ = "kristian.zarebski@ukaea.uk"
 __copyright__ = "Copyright 2024, United Kingdom Atomic Energy Authority"
 
-import loguru
-import toml
-import importlib.metadata
 import os.path
 import pathlib
 
-from multiparser.monitor import FileMonitor as FileMonitor
+import loguru
 
-try:
-    __version__ = importlib.metadata.version("multiparser")
-except importlib.metadata.PackageNotFoundError:
-    _metadata = os.path.join(
-        pathlib.Path(os.path.dirname(__file__)).parents[1], "pyproject.toml"
-    )
-    if os.path.exists(_metadata):
-        __version__ = toml.load(_metadata)["tool"]["poetry"]["version"]
-    else:
-        __version__ = ""
+from multiparser.monitor import FileMonitor as FileMonitor
 
 __all__ = ["FileMonitor"]
 
-loguru.logger.remove()
+# The flag is held on the shared logger so that a re-import of the package,
+# e.g. under a different name, does not remove sinks already in use
+if not getattr(loguru.logger, "_multiparser_initialized", False):
+    loguru.logger.remove()
+    loguru.logger._multiparser_initialized = True  # type: ignore[attr-defined]
+
+
+def _get_version() -> str:
+    """Retrieve the package version from metadata or the project file
+
+    Modules are imported here rather than at the top level as they are
+    only needed the first time the version is requested.
+    """
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("multiparser")
+    except importlib.metadata.PackageNotFoundError:
+        _metadata = os.path.join(
+            pathlib.Path(os.path.dirname(__file__)).parents[1], "pyproject.toml"
+        )
+        if not os.path.exists(_metadata):
+            return ""
+        try:
+            import tomllib
+        except ImportError:
+            import toml
+
+            return toml.load(_metadata)["tool"]["poetry"]["version"]
+
+        with open(_metadata, "rb") as in_f:
+            return tomllib.load(in_f)["tool"]["poetry"]["version"]
+
+
+def __getattr__(name: str) -> str:
+    """Determine the package version only when first requested"""
+    if name != "__version__":
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    globals()["__version__"] = (_version := _get_version())
+    return _version
@@ -5,9 +5,30 @@ Custom Exceptions
 Exceptions for handling failures within individual file monitoring threads
 """
 
+import os
+import queue
 import traceback
 
 
+def _format_exceptions_dict(
+    exceptions_dict: dict[str, BaseException], traceback_cache: dict[int, str]
+) -> str:
+    """Assemble exceptions and their tracebacks into a single info string
+
+    Formatted tracebacks are stored in the cache keyed by exception
+    identity so each exception is only formatted once.
+    """
+    _info: list[str] = ["Multiparser session encountered the following exceptions:\n\t"]
+    for name, exception in exceptions_dict.items():
+        _info.append(f"{name}:\n\t\t")
+        if (_traceback := traceback_cache.get(id(exception))) is None:
+            _traceback = traceback_cache[id(exception)] = "\n\t\t".join(
+                traceback.format_exception(exception)
+            )
+        _info.append(_traceback)
+    return "".join(_info)
+
+
 class FileMonitorThreadException(Exception):
     """Execption captured and re-raised by a single file monitoring thread"""
 
@@ -15,6 +36,31 @@ class FileMonitorThreadException(Exception):
         """Initialise the file monitor exception with those gathered from threads"""
         self.exceptions = file_thread_exceptions
 
+    @classmethod
+    def drain(
+        cls, exception_queue: "queue.SimpleQueue[tuple[str, Exception]]"
+    ) -> "FileMonitorThreadException":
+        """Create the exception from those placed on a queue by file threads
+
+        Parameters
+        ----------
+        exception_queue : queue.SimpleQueue[tuple[str, Exception]]
+            queue of file name and exception pairs, this is emptied
+
+        Returns
+        -------
+        FileMonitorThreadException
+            exception containing all exceptions retrieved from the queue
+        """
+        _exceptions: dict[str, Exception | None] = {}
+        while True:
+            try:
+                _file_name, _exception = exception_queue.get_nowait()
+            except queue.Empty:
+                break
+            _exceptions[_file_name] = _exception
+        return cls(_exceptions)
+
 
 class SessionFailure(Exception):
     """Top level exception for throwing all collected exceptions from child threads"""
@@ -22,13 +68,31 @@ class SessionFailure(Exception):
     def __init__(self, exceptions_dict: dict[str, BaseException]) -> None:
         """Initialise the top-level exception with collected exceptions
 
-        Assembles all exceptions into info string
+        The exceptions are only assembled into an info string when the
+        exception message is rendered, the exception argument being the
+        dictionary of exceptions rather than the message itself
+        """
+        super().__init__(exceptions_dict)
+        self.exceptions = exceptions_dict
+
+        # Formatted tracebacks are kept for the lifetime of this instance,
+        # the exceptions are referenced here so their identities remain valid
+        self._tracebacks: dict[int, str] = {}
+
+    def __str__(self) -> str:
+        """Create the exception message.
+
+        Full tracebacks are included unless the environment variable
+        'MULTIPARSER_VERBOSE_EXCEPTIONS' is set to '0', in which case
+        only the number of exceptions and their sources are given.
         """
-        _info_str: str = ""
-        for name, exception in exceptions_dict.items():
-            _info_str += f"{name}:\n\t\t"
-            _info_str += "\n\t\t".join(traceback.format_exception(exception))
-        super().__init__(
-            "Multiparser session encountered the following exceptions:\n\t"
-            f"{_info_str}"
-        )
+        if os.environ.get("MULTIPARSER_VERBOSE_EXCEPTIONS", "1") == "0":
+            return (
+                f"Multiparser session encountered {len(self.exceptions)} exceptions "
+                f"from: {', '.join(self.exceptions)}"
+            )
+        return self.format_full()
+
+    def format_full(self) -> str:
+        """Assemble all exceptions and their tracebacks into info string"""
+        return _format_exceptions_dict(self.exceptions, self._tracebacks)
@@ -0,0 +1,381 @@
+"""
+Multiparser Globbing
+====================
+
+Contains functions for converting globular expressions into compiled regular
+expressions, allowing file paths to be tested against a set of expressions
+without repeated walks of the file system.
+
+"""
+
+__date__ = "2023-10-16"
+__author__ = "Kristian Zarebski"
+__maintainer__ = "Kristian Zarebski"
+__email__ = "kristian.zarebski@ukaea.uk"
+__copyright__ = "Copyright 2024, United Kingdom Atomic Energy Authority"
+
+import functools
+import glob
+import os
+import re
+import time
+import typing
+
+__all__ = [
+    "translate_glob",
+    "compile_glob_union",
+    "validate_glob",
+    "has_magic",
+    "match_globs",
+    "DirectoryListings",
+]
+
+_SEPARATOR: str = re.escape(os.sep)
+_MAGIC: re.Pattern[str] = re.compile("[*?[]")
+_RACY_INTERVAL_NS: int = 2_000_000_000
+
+
+def _translate_class(component: str, start: int) -> tuple[str, int]:
+    """Translate a '[' character class starting at the given position
+
+    Returns the regular expression for the class and the position following
+    it, an unterminated class being treated as a literal '['.
+    """
+    n = len(component)
+    j = start
+    if j < n and component[j] == "!":
+        j += 1
+    if j < n and component[j] == "]":
+        j += 1
+    while j < n and component[j] != "]":
+        j += 1
+    if j >= n:
+        return "\\[", start
+    _set = component[start:j].replace("\\", "\\\\")
+    if _set.startswith("!"):
+        _set = "^" + _set[1:]
+    elif _set.startswith("^"):
+        _set = "\\" + _set
+    return f"[{_set}]", j + 1
+
+
+def _translate_component(component: str) -> str:
+    """Translate a single path component of a globular expression to regex"""
+    _out: list[str] = []
+    i, n = 0, len(component)
+
+    while i < n:
+        _char = component[i]
+        i += 1
+        if _char == "*":
+            # Consecutive wildcards are equivalent to a single wildcard
+            if not _out or _out[-1] != f"[^{_SEPARATOR}]*":
+                _out.append(f"[^{_SEPARATOR}]*")
+        elif _char == "?":
+            _out.append(f"[^{_SEPARATOR}]")
+        elif _char == "[":
+            _class, i = _translate_class(component, i)
+            _out.append(_class)
+        else:
+            _out.append(re.escape(_char))
+
+    # As with 'glob', wildcards do not match hidden files unless
+    # the component itself explicitly starts with '.'
+    if component[:1] in ("*", "?", "["):
+        _out.insert(0, "(?!\\.)")
+
+    return "".join(_out)
+
+
+def translate_glob(expression: str) -> str:
+    """Convert a globular expression into a regular expression string.
+
+    Unlike 'fnmatch.translate', wildcards do not cross path separators and do
+    not match hidden files, mirroring the behaviour of 'glob.glob'.
+
+    Parameters
+    ----------
+    expression : str
+        globular expression to translate
+
+    Returns
+    -------
+    str
+        regular expression which matches the same paths as the expression
+    """
+    return _SEPARATOR.join(
+        _translate_component(component) for component in expression.split(os.sep)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def compile_glob_union(expressions: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile a set of globular expressions into a single pattern.
+
+    Parameters
+    ----------
+    expressions : tuple[str, ...]
+        globular expressions to combine
+
+    Returns
+    -------
+    re.Pattern[str] | None
+        a pattern matching any path matched by one of the expressions,
+        None if no expressions are given
+    """
+    if not expressions:
+        return None
+    _alternatives: str = "|".join(
+        f"(?:{translate_glob(expression)})" for expression in expressions
+    )
+    return re.compile(f"(?:{_alternatives})\\Z")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(expression: str) -> re.Pattern[str]:
+    """Compile a single globular expression"""
+    return re.compile(translate_glob(expression))
+
+
+def validate_glob(expression: typing.Any) -> None:
+    """Check a globular expression without searching the file system.
+
+    Parameters
+    ----------
+    expression : typing.Any
+        globular expression to validate
+
+    Raises
+    ------
+    AssertionError
+        if the expression is not a string or cannot be converted into
+        a regular expression
+    """
+    if not isinstance(expression, str):
+        raise AssertionError("Globular expression must be of type AnyStr")
+    try:
+        _compile_glob(expression)
+    except re.error as e:
+        raise AssertionError(f"Invalid globular expression '{expression}': {e}")
+
+
+def has_magic(expression: str) -> bool:
+    """Check whether an expression contains any wildcards.
+
+    Parameters
+    ----------
+    expression : str
+        globular expression to check
+
+    Returns
+    -------
+    bool
+        False if the expression can only match a single literal path
+    """
+    return bool(_MAGIC.search(expression))
+
+
+@functools.lru_cache(maxsize=256)
+def _split_glob(expression: str) -> tuple[str, re.Pattern[str]] | None:
+    """Split an expression with wildcards only in the final path component"""
+    _directory, _name = os.path.split(expression)
+    if not _MAGIC.search(_name) or _MAGIC.search(_directory):
+        return None
+    return _directory, re.compile(f"{_translate_component(_name)}\\Z")
+
+
+class DirectoryListings:
+    """Contents of directories read while searching for files.
+
+    A directory is only read again if its modification time has changed
+    since it was last read. Within a single refresh each directory is
+    checked at most once.
+    """
+
+    def __init__(self) -> None:
+        self._listings: dict[str, tuple[int, list[str]]] = {}
+        self._checked: set[str] = set()
+        self._matches: dict[
+            tuple[str, re.Pattern[str]], tuple[list[str], list[re.Match[str]]]
+        ] = {}
+        self._previous_matches: dict[
+            tuple[str, re.Pattern[str]], tuple[list[str], list[re.Match[str]]]
+        ] = {}
+
+    def refresh(self) -> None:
+        """Start a new refresh, directories will be checked for changes again"""
+        self._checked.clear()
+        # Only matches used during the last refresh are kept, so those for
+        # patterns no longer in use, e.g. after tracking changes, are dropped
+        self._previous_matches = self._matches
+        self._matches = {}
+
+    def names(self, directory: str) -> list[str]:
+        """Retrieve the names of entries within a directory
+
+        Parameters
+        ----------
+        directory : str
+            directory to list, an empty string being the current directory
+
+        Returns
+        -------
+        list[str]
+            names of all entries within the directory, empty if the
+            directory cannot be read
+        """
+        if directory in self._checked:
+            return self._listings[directory][1]
+
+        self._checked.add(directory)
+
+        try:
+            _modified: int = os.stat(directory or os.curdir).st_mtime_ns
+        except OSError:
+            self._listings[directory] = (-1, [])
+            return []
+
+        # A directory modified within the timestamp resolution of the last
+        # read may have changed again without its modification time changing
+        _recent: bool = time.time_ns() - _modified < _RACY_INTERVAL_NS
+
+        if (_cached := self._listings.get(directory)) and (
+            _cached[0] == _modified and not _recent
+        ):
+            return _cached[1]
+
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                _names = [entry.name for entry in entries]
+        except OSError:
+            _names = []
+
+        self._listings[directory] = (_modified, _names)
+        return _names
+
+    def matches(self, directory: str, pattern: re.Pattern[str]) -> list[re.Match[str]]:
+        """Match the names of entries within a directory against a pattern
+
+        Results are kept until the directory is next read, so matching is
+        only repeated for directories which have changed. Results not used
+        within a refresh are discarded at the next.
+
+        Parameters
+        ----------
+        directory : str
+            directory to list, an empty string being the current directory
+        pattern : re.Pattern[str]
+            pattern which entry names must match in full
+
+        Returns
+        -------
+        list[re.Match[str]]
+            matches for each entry name matching the pattern
+        """
+        _names: list[str] = self.names(directory)
+
+        # The cached names are replaced whenever the directory is read again
+        _key = (directory, pattern)
+        _cached = self._matches.get(_key) or self._previous_matches.get(_key)
+        if _cached and _cached[0] is _names:
+            self._matches[_key] = _cached
+            return _cached[1]
+
+        _found: list[re.Match[str]] = [
+            _match for name in _names if (_match := pattern.match(name))
+        ]
+        self._matches[_key] = (_names, _found)
+        return _found
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_component(component: str) -> re.Pattern[str]:
+    """Compile a single path component of a globular expression"""
+    return re.compile(f"{_translate_component(component)}\\Z")
+
+
+def _expand_glob(expression: str, listings: DirectoryListings) -> typing.Iterator[str]:
+    """Expand an expression using directory listings in place of 'glob'"""
+    _directory, _name = os.path.split(expression)
+
+    # Expressions ending in a separator only match directories
+    if not _name:
+        yield from glob.iglob(expression)
+        return
+
+    if not has_magic(expression):
+        if os.path.lexists(expression):
+            yield expression
+        return
+
+    _directories: typing.Iterable[str] = (
+        _expand_glob(_directory, listings) if has_magic(_directory) else (_directory,)
+    )
+
+    if not has_magic(_name):
+        for directory in _directories:
+            if os.path.lexists(_path := os.path.join(directory, _name)):
+                yield _path
+        return
+
+    _pattern: re.Pattern[str] = _compile_component(_name)
+    for directory in _directories:
+        for _match in listings.matches(directory, _pattern):
+            yield os.path.join(directory, _match.string)
+
+
+@functools.lru_cache(maxsize=256)
+def _combine_names(expressions: tuple[str, ...]) -> re.Pattern[str]:
+    """Combine the final components of expressions into one numbered alternation"""
+    _alternatives: str = "|".join(
+        f"({_translate_component(os.path.split(expression)[1])})"
+        for expression in expressions
+    )
+    return re.compile(f"(?:{_alternatives})\\Z")
+
+
+def match_globs(
+    expressions: typing.Sequence[str], listings: DirectoryListings
+) -> typing.Iterator[tuple[str, int]]:
+    """Iterate through paths matching any of a set of globular expressions.
+
+    Expressions with wildcards only in the final path component are grouped
+    by directory, each directory's entries then being matched once against
+    a single pattern combining all expressions for that directory. All other
+    expressions are expanded component by component, also using the
+    directory contents already read. Where a path matches more than one
+    expression, the earliest expression is used.
+
+    Parameters
+    ----------
+    expressions : typing.Sequence[str]
+        globular expressions to expand
+    listings : DirectoryListings
+        directory contents already read
+
+    Yields
+    ------
+    tuple[str, int]
+        each matching path and the index of the earliest expression it matched
+    """
+    _by_directory: dict[str, list[int]] = {}
+    _found: dict[str, int] = {}
+
+    for i, expression in enumerate(expressions):
+        if _split := _split_glob(expression):
+            _by_directory.setdefault(_split[0], []).append(i)
+            continue
+        for path in _expand_glob(expression, listings):
+            _found.setdefault(path, i)
+
+    for directory, indices in _by_directory.items():
+        _pattern = _combine_names(tuple(expressions[i] for i in indices))
+        for _match in listings.matches(directory, _pattern):
+            if not _match.lastindex:
+                continue
+            _path = os.path.join(directory, _match.string)
+            _index = indices[_match.lastindex - 1]
+            if _index < _found.get(_path, _index + 1):
+                _found[_path] = _index
+
+    yield from _found.items()
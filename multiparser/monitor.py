@@ -11,48 +11,212 @@ a whole.
 
 """
 
+from __future__ import annotations
+
 __date__ = "2023-10-16"
 __author__ = "Kristian Zarebski"
 __maintainer__ = "Kristian Zarebski"
 __email__ = "kristian.zarebski@ukaea.uk"
 __copyright__ = "Copyright 2024, United Kingdom Atomic Energy Authority"
 
+import atexit
 import contextlib
-import glob
 import logging
 import multiprocessing
 import re
 import string
 import sys
 import threading
-import time
 import typing
+import weakref
 from multiprocessing.synchronize import Event
 
 import loguru
 
 import multiparser.exceptions as mp_exc
+import multiparser.globbing as mp_glob
 import multiparser.thread as mp_thread
 from multiparser.typing import FullFileTrackable, LogFileTrackable, TrackedValues
 
 __all__ = ["FileMonitor"]
 
 
-def _default_callback(
-    _: typing.Dict[str, typing.Any], meta: typing.Dict[str, typing.Any]
-) -> None:
+class _BufferedStream:
+    """Sink which collects log messages and writes them to a stream in batches
+
+    Loguru flushes any stream sink defining a 'flush' method after every
+    message, this sink instead holds messages until either the buffer size is
+    exceeded or the flush interval has passed, so that many small writes are
+    collapsed into a few larger ones.
+    """
+
+    def __init__(
+        self,
+        stream: typing.TextIO,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 0.2,
+    ) -> None:
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._buffer: list[str] = []
+        self._buffered_chars: int = 0
+        self._lock = threading.Lock()
+        self._pending = threading.Event()
+        self._closed = threading.Event()
+        self._flusher: threading.Thread | None = None
+
+    def write(self, message: str) -> None:
+        """Add a message to the buffer, writing out if the buffer is full"""
+        with self._lock:
+            self._buffer.append(message)
+            self._buffered_chars += len(message)
+            if self._buffered_chars >= self._buffer_size:
+                self._write_out()
+            elif not self._pending.is_set():
+                self._pending.set()
+                # A single thread writes out messages for the lifetime of the sink
+                if not self._flusher:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop, daemon=True
+                    )
+                    self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        """Write out buffered messages once they have been held for the interval"""
+        while not self._closed.is_set():
+            self._pending.wait()
+            # Wait for further messages unless the sink is closed in the meantime
+            self._closed.wait(self._flush_interval)
+            self.drain()
+
+    def _write_out(self) -> None:
+        self._pending.clear()
+        if not self._buffer:
+            return
+        # Stream may have been closed before the final flush, e.g. at exit
+        with contextlib.suppress(ValueError):
+            self._stream.write("".join(self._buffer))
+            self._stream.flush()
+        self._buffer.clear()
+        self._buffered_chars = 0
+
+    def drain(self) -> None:
+        """Write all buffered messages to the stream"""
+        with self._lock:
+            self._write_out()
+
+    def stop(self) -> None:
+        """Called by loguru when the sink is removed"""
+        self._closed.set()
+        # Wake the flusher if it is waiting for messages so that it exits
+        self._pending.set()
+        if self._flusher and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self.drain()
+
+
+_LOG_STREAMS: weakref.WeakSet[_BufferedStream] = weakref.WeakSet()
+
+# Synthetic content used to check custom log parsers before launching threads
+_PARSER_TEST_STR: str = (
+    string.ascii_lowercase + string.ascii_uppercase + string.ascii_letters
+) * 100
+
+# Parser arguments for which each custom log parser has already been checked
+_VALIDATED_PARSERS: weakref.WeakKeyDictionary[
+    typing.Callable, list[dict[str, typing.Any]]
+] = weakref.WeakKeyDictionary()
+
+
+_PLAIN_LOG_FORMAT: str = "{elapsed} | {level: <8} | multiparser | {message}"
+_COLOR_LOG_FORMAT: str = "{level.icon} | <green>{elapsed}</green>  | <level>{level: <8}</level> | <c>multiparser</c> | {message}"
+
+# Sinks shared by all monitors with the same logging options, these being
+# the loguru handler ID and the number of monitors currently using it
+_LOG_HANDLERS: dict[tuple[bool, int], list[int]] = {}
+_LOG_HANDLERS_LOCK: threading.Lock = threading.Lock()
+
+
+def _acquire_log_handler(log_level: str | int, colorize: bool) -> tuple[bool, int]:
+    """Retrieve a log handler for the given options, adding one if none exists
+
+    Each handler renders and writes every record it accepts, so a handler
+    per monitor would result in records being repeated for every monitor
+    instance in the process.
+
+    Parameters
+    ----------
+    log_level : str | int
+        minimum level of records to write
+    colorize : bool
+        whether to use the colored log format
+
+    Returns
+    -------
+    tuple[bool, int]
+        key identifying the handler, used to release it
+    """
+    # Levels given by name or number are the same handler, e.g. "INFO" and 20
+    _level_no: int = (
+        log_level if isinstance(log_level, int) else loguru.logger.level(log_level).no
+    )
+    _key: tuple[bool, int] = (colorize, _level_no)
+
+    with _LOG_HANDLERS_LOCK:
+        if _handler := _LOG_HANDLERS.get(_key):
+            _handler[1] += 1
+            return _key
+
+        # Records are placed on a queue and written to stderr by a single
+        # background thread, rather than each file monitor thread blocking on
+        # formatting and I/O while holding the sink lock
+        _stream = _BufferedStream(sys.stderr)
+        _LOG_STREAMS.add(_stream)
+
+        _LOG_HANDLERS[_key] = [
+            loguru.logger.add(
+                _stream,
+                format=_COLOR_LOG_FORMAT if colorize else _PLAIN_LOG_FORMAT,
+                colorize=colorize,
+                level=_level_no,
+                enqueue=True,
+            ),
+            1,
+        ]
+    return _key
+
+
+def _release_log_handler(key: tuple[bool, int]) -> None:
+    """Remove a log handler once no monitor is using it"""
+    with _LOG_HANDLERS_LOCK:
+        _handler = _LOG_HANDLERS[key]
+        _handler[1] -= 1
+        if not _handler[1]:
+            loguru.logger.remove(_handler[0])
+            del _LOG_HANDLERS[key]
+
+
+@atexit.register
+def _flush_logs() -> None:
+    """Ensure any pending log records are written on exit"""
+    loguru.logger.complete()
+    for stream in _LOG_STREAMS:
+        stream.drain()
+
+
+def _default_callback(_: dict[str, typing.Any], meta: dict[str, typing.Any]) -> None:
     """Default per file callback if none set globally or per file"""
+    # Arguments are only formatted by loguru if the record is emitted
     loguru.logger.warning(
-        f"Changes detected but no callback set for {meta['file_name']}."
+        "Changes detected but no callback set for {}.", meta["file_name"]
     )
 
 
 def _check_log_globex(trackables: list[LogFileTrackable]) -> None:
     """Check globular expressions before passing them to thread"""
     for expression in trackables:
-        if not isinstance(_glob_ex := expression["glob_expr"], str):
-            raise AssertionError("Globular expression must be of type AnyStr")
-        glob.glob(_glob_ex)
+        mp_glob.validate_glob(expression["glob_expr"])
 
 
 class FileMonitor:
@@ -76,7 +240,7 @@ class FileMonitor:
         exception_callback: typing.Callable | None = None,
         notification_callback: typing.Callable | None = None,
         termination_trigger: Event | None = None,
-        subprocess_triggers: typing.List[Event] | None = None,
+        subprocess_triggers: list[Event] | None = None,
         timeout: int | None = None,
         lock_callbacks: bool = True,
         interval: float = 0.1,
@@ -90,7 +254,7 @@ class FileMonitor:
 
         Parameters
         ----------
-        threads_recorder : typing.Dict
+        threads_recorder : dict
             Dictionary for caching values read from the file parsing threads
         per_thread_callback : typing.Callable, optional
             function to be executed whenever a monitored file is modified
@@ -100,7 +264,7 @@ class FileMonitor:
         notification_callback : typing.Callable | None, optional
             function to be called when a new file is found, default is
             a print statement
-        subprocess_triggers : typing.List[Event], optional
+        subprocess_triggers : list[Event], optional
             if provided, events which will be set if monitor terminates
         timeout : int, optional
             time after which to terminate, default is None
@@ -114,7 +278,8 @@ class FileMonitor:
         flatten_data : bool, optional
             whether to convert data to a single level dictionary of key-value pairs
         plain_logging : bool, optional
-            turn off color/symbols in log outputs, default False
+            turn off color/symbols in log outputs, default False. These are
+            always off if stderr is not a terminal
         terminate_all_on_failure : bool, optional
             abort all file monitors if exception thrown, default False
         file_limit : int, optional
@@ -126,22 +291,21 @@ class FileMonitor:
         self._per_thread_callback = per_thread_callback or _default_callback
         self._notification_callback = notification_callback
         self._shutdown_on_thread_failure: bool = terminate_all_on_fail
-        self._exceptions: typing.Dict[str, Exception | None] = {}
+        self._exceptions: dict[str, Exception | None] = {}
         self._exception_callback = self._generate_exception_callback(exception_callback)
-        self._file_threads_mutex: "threading.Lock | None" = (
-            threading.Lock() if lock_callbacks else None
+        self._file_threads_mutex: typing.ContextManager = (
+            threading.Lock() if lock_callbacks else contextlib.nullcontext()
         )
-        self._subprocess_triggers: typing.List[Event] | None = subprocess_triggers
+        self._subprocess_triggers: list[Event] | None = subprocess_triggers
         self._monitor_termination_trigger = (
             termination_trigger or multiprocessing.Event()
         )
-        self._known_files: typing.List[str] = []
-        self._file_trackables: typing.List[FullFileTrackable] = []
-        self._log_trackables: typing.List[LogFileTrackable] = []
-        self._excluded_patterns: typing.List[str] = []
-        self._file_monitor_thread: threading.Thread | None = None
-        self._log_monitor_thread: threading.Thread | None = None
-        self._timer_process: multiprocessing.Process | None = None
+        self._known_files: list[str] = []
+        self._file_trackables: list[FullFileTrackable] = []
+        self._log_trackables: list[LogFileTrackable] = []
+        self._excluded_patterns: list[str] = []
+        self._monitor_thread: threading.Thread | None = None
+        self._timer: threading.Timer | None = None
         self._flatten_data: bool = flatten_data
         self._thread_limit: int | None = file_limit
 
@@ -149,22 +313,35 @@ class FileMonitor:
         self._file_thread_exception_test_case: bool = False
         self._log_thread_exception_test_case: bool = False
 
-        _plain_log: str = "{elapsed} | {level: <8} | multiparser | {message}"
-        _color_log: str = "{level.icon} | <green>{elapsed}</green>  | <level>{level: <8}</level> | <c>multiparser</c> | {message}"
-
-        self._log_id = loguru.logger.add(
-            sys.stderr,
-            format=_plain_log if plain_logging else _color_log,
-            colorize=not plain_logging,
-            level=log_level,
+        # Colors are only used where output is to a terminal
+        self._log_handler: tuple[bool, int] | None = _acquire_log_handler(
+            log_level, not plain_logging and sys.stderr.isatty()
         )
 
     def _generate_exception_callback(
         self, user_callback: typing.Callable | None
     ) -> typing.Callable:
-        def _exception_callback(
+        def _record_exception(
             exception: Exception,
             _exceptions: dict[str, Exception | None] = self._exceptions,
+            thread_exception_type: type[
+                mp_exc.FileMonitorThreadException
+            ] = mp_exc.FileMonitorThreadException,
+        ) -> None:
+            # Both launchers report from the single monitor thread, so
+            # exceptions are recorded without locking
+            if isinstance(exception, thread_exception_type):
+                _exceptions.update(exception.exceptions)
+            else:
+                _exceptions["__main__"] = exception
+
+        # Nothing else to do on failure so only record the exception
+        if not user_callback and not self._shutdown_on_thread_failure:
+            return _record_exception
+
+        def _exception_callback(
+            exception: Exception,
+            record_exception: typing.Callable = _record_exception,
             user_defined=user_callback,
             abort_on_fail=self._shutdown_on_thread_failure,
             abort_func=self.terminate,
@@ -176,26 +353,25 @@ class FileMonitor:
                 loguru.logger.error("Detected file monitor thread failure, aborting...")
                 abort_func()
 
-            if isinstance(exception, mp_exc.FileMonitorThreadException):
-                _exceptions |= exception.exceptions
-            else:
-                _exceptions["__main__"] = exception
+            record_exception(exception)
 
         return _exception_callback
 
-    def _create_monitor_threads(self) -> None:
-        """Create threads for the log file and full file monitors"""
-
-        def _full_file_monitor_func(
-            ff_trackables: typing.List[FullFileTrackable],
-            exc_glob_exprs: typing.List[str],
-            file_list: typing.List[str],
-            termination_trigger: threading.Event,
-            interval: float,
-            flatten_data: bool,
-        ) -> None:
-            """Creates and runs thread launcher for full file monitoring"""
-            _full_file_threads = mp_thread.FullFileThreadLauncher(
+    def _monitor_func(
+        self,
+        ff_trackables: list[FullFileTrackable],
+        lf_trackables: list[LogFileTrackable],
+        exc_glob_exprs: list[str],
+        file_list: list[str],
+        termination_trigger: threading.Event,
+        interval: float,
+        flatten_data: bool,
+    ) -> None:
+        """Creates and runs thread launchers for full and log file monitoring"""
+        # Both launchers are created even if no files are tracked yet, as
+        # they share the trackable lists which may be extended while running
+        _launchers: list[mp_thread.FileThreadLauncher] = [
+            mp_thread.FullFileThreadLauncher(
                 trackables=ff_trackables,
                 exclude_files_globex=exc_glob_exprs,
                 refresh_interval=interval,
@@ -208,19 +384,8 @@ class FileMonitor:
                 notification_callback=self._notification_callback,
                 flatten_data=flatten_data,
                 test_exception_capture=self._file_thread_exception_test_case,
-            )
-            _full_file_threads.run()
-
-        def _log_file_monitor_func(
-            lf_trackables: typing.List[LogFileTrackable],
-            exc_glob_exprs: typing.List[str],
-            file_list: typing.List[str],
-            termination_trigger: threading.Event,
-            interval: float,
-            flatten_data: bool,
-        ) -> None:
-            """Creates and runs thread launcher for log file monitoring"""
-            _log_file_threads = mp_thread.LogFileThreadLauncher(
+            ),
+            mp_thread.LogFileThreadLauncher(
                 trackables=lf_trackables,
                 exclude_files_globex=exc_glob_exprs,
                 refresh_interval=interval,
@@ -233,24 +398,18 @@ class FileMonitor:
                 notification_callback=self._notification_callback,
                 flatten_data=flatten_data,
                 test_exception_capture=self._log_thread_exception_test_case,
-            )
-            _log_file_threads.run()
-
-        self._file_monitor_thread = threading.Thread(
-            target=_full_file_monitor_func,
-            args=(
-                self._file_trackables,
-                self._excluded_patterns,
-                self._known_files,
-                self._monitor_termination_trigger,
-                self._interval,
-                self._flatten_data,
             ),
-        )
+        ]
+
+        # Both launchers are refreshed from this one thread
+        mp_thread.run_launchers(_launchers, termination_trigger, interval)
 
-        self._log_monitor_thread = threading.Thread(
-            target=_log_file_monitor_func,
+    def _create_monitor_threads(self) -> None:
+        """Create the thread which runs the log file and full file monitors"""
+        self._monitor_thread = threading.Thread(
+            target=self._monitor_func,
             args=(
+                self._file_trackables,
                 self._log_trackables,
                 self._excluded_patterns,
                 self._known_files,
@@ -267,13 +426,17 @@ class FileMonitor:
         if hasattr(parser, "__skip_validation"):
             return
 
-        _test_str = string.ascii_lowercase
-        _test_str += string.ascii_uppercase
-        _test_str += string.ascii_letters
-        _test_str *= 100
+        # Parser has already been checked with these arguments
+        with contextlib.suppress(TypeError):
+            if parser_kwargs in _VALIDATED_PARSERS.get(parser, []):
+                return
+
         try:
             _out = parser(
-                _test_str, __input_file=__file__, __read_bytes=None, **parser_kwargs
+                _PARSER_TEST_STR,
+                __input_file=__file__,
+                __read_bytes=None,
+                **parser_kwargs,
             )
 
             # If the custom parser returns a list of entries, not just one
@@ -300,32 +463,36 @@ class FileMonitor:
                 "Parser function must be decorated using the multiparser.log_parser decorator"
             )
 
-    def exclude(self, path_glob_exprs: typing.List[str] | str) -> None:
+        # Callables which do not support weak references are always re-checked
+        with contextlib.suppress(TypeError):
+            _VALIDATED_PARSERS.setdefault(parser, []).append(parser_kwargs)
+
+    def exclude(self, path_glob_exprs: list[str] | str) -> None:
         """Exclude a set of files from monitoring.
 
         Parameters
         ----------
-        path_glob_exprs : typing.List[str] | str
+        path_glob_exprs : list[str] | str
             a list or string defining globular expressions for files
             to exclude from tracking
         """
         if isinstance(path_glob_exprs, str):
-            self._excluded_patterns.append(path_glob_exprs)
-        else:
-            self._excluded_patterns += path_glob_exprs
+            path_glob_exprs = [path_glob_exprs]
 
         # Check globular expressions before passing them to thread
-        for expression in self._excluded_patterns:
-            glob.glob(expression)
+        for expression in path_glob_exprs:
+            mp_glob.validate_glob(expression)
+
+        self._excluded_patterns += path_glob_exprs
 
     def track(
         self,
         *,
-        path_glob_exprs: typing.List[str] | str,
+        path_glob_exprs: list[str] | str,
         tracked_values: TrackedValues | None = None,
         callback: typing.Callable | None = None,
         parser_func: typing.Callable | None = None,
-        parser_kwargs: typing.Dict | None = None,
+        parser_kwargs: dict | None = None,
         static: bool = False,
         file_type: str | None = None,
     ) -> None:
@@ -338,17 +505,17 @@ class FileMonitor:
 
         Parameters
         ----------
-        path_glob_exprs : typing.List[str] | str
+        path_glob_exprs : list[str] | str
             set of or single globular expression(s) defining files
             to monitor
-        tracked_values : typing.List[str] | None, optional
+        tracked_values : list[str] | None, optional
             a list of regular expressions defining variables to track
             within the file, by default None
         callback : typing.Callable | None, optional
             override the global per file callback for this instance
         parser_func : typing.Callable | None, optional
             provide a custom parsing function
-        parser_kwargs : typing.Dict | None, optional
+        parser_kwargs : dict | None, optional
             arguments to include when running the specified custom parser
         static : bool, optional
             (if known) whether the given file(s) are written only once
@@ -358,46 +525,36 @@ class FileMonitor:
             recognition with a recognised parser e.g. 'yaml'
         """
         if isinstance(path_glob_exprs, str):
-            _parsing_dict: typing.Dict[str, typing.Any] = {
-                "glob_expr": path_glob_exprs,
-                "tracked_values": tracked_values,
-                "static": static,
-                "parser_func": parser_func,
-                "parser_kwargs": parser_kwargs,
-                "file_type": file_type,
-                "callback": callback or self._per_thread_callback,
-            }
-            self._file_trackables.append(_parsing_dict)
-        else:
-            self._file_trackables += [
-                {
-                    "glob_expr": g,
-                    "tracked_values": tracked_values,
-                    "static": static,
-                    "parser_func": parser_func,
-                    "parser_kwargs": parser_kwargs,
-                    "file_type": file_type,
-                    "callback": callback or self._per_thread_callback,
-                }
-                for g in path_glob_exprs
-            ]
+            path_glob_exprs = [path_glob_exprs]
+
+        # Entries shared by all expressions are assembled once
+        _parsing_dict: dict[str, typing.Any] = {
+            "tracked_values": tracked_values,
+            "static": static,
+            "parser_func": parser_func,
+            "parser_kwargs": parser_kwargs,
+            "file_type": file_type,
+            "callback": callback or self._per_thread_callback,
+        }
 
         # Check globular expressions before passing them to thread
-        for expression in self._file_trackables:
-            if not isinstance(_glob_ex := expression["glob_expr"], str):
-                raise AssertionError("Globular expression must be of type AnyStr")
-            glob.glob(_glob_ex)
+        for expression in path_glob_exprs:
+            mp_glob.validate_glob(expression)
+
+        self._file_trackables.extend(
+            {"glob_expr": g} | _parsing_dict for g in path_glob_exprs
+        )
 
     def tail(
         self,
         *,
-        path_glob_exprs: typing.List[str] | str,
+        path_glob_exprs: list[str] | str,
         tracked_values: TrackedValues | None = None,
-        skip_lines_w_pattern: typing.List[re.Pattern | str] | None = None,
-        labels: str | typing.List[str | None] | None = None,
+        skip_lines_w_pattern: list[re.Pattern | str] | None = None,
+        labels: str | list[str | None] | None = None,
         callback: typing.Callable | None = None,
         parser_func: typing.Callable | None = None,
-        parser_kwargs: typing.Dict | None = None,
+        parser_kwargs: dict | None = None,
     ) -> None:
         """Tail a set of files.
 
@@ -447,17 +604,17 @@ class FileMonitor:
 
         Parameters
         ----------
-        path_glob_exprs : typing.List[str] | str
+        path_glob_exprs : list[str] | str
             set of or single globular expression(s) defining files
             to monitor
-        tracked_values : typing.List[Pattern | str], optional
+        tracked_values : list[Pattern | str], optional
             a set of regular expressions or strings defining variables to track.
             Where one capture group is defined the user must provide
             an associative label. Where two are defined, the first capture
             group is taken to be the label, the second the value.
-        skip_lines_w_pattern : typing.List[Pattern | str], optional
+        skip_lines_w_pattern : list[Pattern | str], optional
             specify patterns defining lines which should be skipped
-        labels : typing.List[str], optional
+        labels : list[str], optional
             define the label to assign to each value, if an element in the
             list is None, then a capture group is used. If labels itself is
             None, it is assumed all matches have a label capture group.
@@ -465,7 +622,7 @@ class FileMonitor:
             override the global per file callback for this instance
         parser_func : typing.Callable | None, optional
             provide a custom parsing function
-        parser_kwargs : typing.Dict | None, optional
+        parser_kwargs : dict | None, optional
             arguments to include when running the specified custom parser
         """
         if parser_func:
@@ -483,8 +640,8 @@ class FileMonitor:
                 "method 'tail'"
             )
 
-        _tracked_values: typing.List[str | re.Pattern]
-        _labels: typing.List[str | None]
+        _tracked_values: list[str | re.Pattern]
+        _labels: list[str | None]
 
         if tracked_values is None:
             _tracked_values = []
@@ -507,7 +664,7 @@ class FileMonitor:
 
         if not _tracked_values or parser_func:
             _reg_lab_expr_pairing: (
-                typing.List[typing.Tuple[str | None, re.Pattern[str] | str]] | None
+                list[tuple[str | None, re.Pattern[str] | str]] | None
             ) = None
         else:
             _labels = _labels or [None] * len(_tracked_values)
@@ -516,101 +673,112 @@ class FileMonitor:
             ]
 
         if isinstance(path_glob_exprs, (str, re.Pattern)):
-            _parsing_dict: typing.Dict[str, typing.Any] = {
-                "glob_expr": path_glob_exprs,
-                "tracked_values": _reg_lab_expr_pairing,
-                "static": False,
-                "parser_func": parser_func,
-                "parser_kwargs": parser_kwargs,
-                "callback": callback or self._per_thread_callback,
-                "ignore_lines": skip_lines_w_pattern,
-            }
-            self._log_trackables.append(_parsing_dict)
-        else:
-            self._log_trackables += [
-                {
-                    "glob_expr": g,
-                    "tracked_values": _reg_lab_expr_pairing,
-                    "static": False,
-                    "parser_func": parser_func,
-                    "parser_kwargs": parser_kwargs,
-                    "callback": callback or self._per_thread_callback,
-                    "ignore_lines": skip_lines_w_pattern,
-                }
-                for g in path_glob_exprs
-            ]
+            path_glob_exprs = [path_glob_exprs]  # type: ignore
+
+        # Entries shared by all expressions are assembled once
+        _parsing_dict: dict[str, typing.Any] = {
+            "tracked_values": _reg_lab_expr_pairing,
+            "static": False,
+            "parser_func": parser_func,
+            "parser_kwargs": parser_kwargs,
+            "callback": callback or self._per_thread_callback,
+            "ignore_lines": skip_lines_w_pattern,
+        }
 
-        _check_log_globex(self._log_trackables)
+        _new_trackables: list[LogFileTrackable] = [
+            {"glob_expr": g} | _parsing_dict for g in path_glob_exprs
+        ]
+        _check_log_globex(_new_trackables)
+        self._log_trackables += _new_trackables
 
     @classmethod
-    def _spin_timer(cls, duration: int, trigger: Event) -> None:
+    def _timeout_reached(cls, duration: int, trigger: Event) -> None:
         """When a timeout has been specified ensure trigger is set within period"""
-        loguru.logger.debug(f"Using timeout of {duration}s")
-
-        time.sleep(duration)
-
         if not trigger.is_set():
             loguru.logger.info(f"File monitor timeout called after {duration}s")
             trigger.set()
 
     def _launch_timer(self) -> None:
         """Run timeout timer if user has specified a timeout in seconds"""
-        self._timer_process = multiprocessing.Process(
-            target=self._spin_timer,
+        loguru.logger.debug(f"Using timeout of {self._timeout}s")
+        self._timer = threading.Timer(
+            self._timeout,  # type: ignore
+            self._timeout_reached,
             args=(self._timeout, self._monitor_termination_trigger),
         )
-        self._timer_process.start()
+        self._timer.daemon = True
+        self._timer.start()
 
     def terminate(self) -> None:
         """Terminate all monitors."""
         self._monitor_termination_trigger.set()
+        if self._timer:
+            self._timer.cancel()
         self._close_processes()
 
     def _close_processes(self) -> None:
         # If for some reason the user calls 'terminate' before run and is not
         # using file monitor as a context manager
-        if not self._file_monitor_thread or not self._log_monitor_thread:
+        if not self._monitor_thread:
             raise AssertionError("FileMonitor must be used as a context manager.")
 
         with contextlib.suppress(RuntimeError):
-            self._file_monitor_thread.join()
-
-        with contextlib.suppress(RuntimeError):
-            self._log_monitor_thread.join()
+            self._monitor_thread.join()
 
-        # set any triggers the user has attached to this monitor
+        # set any triggers the user has attached to this monitor, each
+        # distinct event is set once, skipping those already set
         if self._subprocess_triggers:
+            _set_triggers: set[int] = {id(self._monitor_termination_trigger)}
             for trigger in self._subprocess_triggers:
+                if id(trigger) in _set_triggers:
+                    continue
                 trigger.set()
+                _set_triggers.add(id(trigger))
 
         if not self._known_files:
             loguru.logger.warning("No files were processed during this session.")
 
     def run(self) -> None:
         """Launch all monitors"""
-        if not self._file_monitor_thread or not self._log_monitor_thread:
+        if not self._monitor_thread:
             raise AssertionError("FileMonitor must be used as a context manager.")
         if self._timeout:
             self._launch_timer()
-        self._file_monitor_thread.start()
-        self._log_monitor_thread.start()
+        self._monitor_thread.start()
+
+    def _release_logging(self) -> None:
+        """Release the log handler used by this monitor, if not already released"""
+        if self._log_handler:
+            _release_log_handler(self._log_handler)
+            self._log_handler = None
 
     def __enter__(self) -> "FileMonitor":
         """Setup all threads"""
-        self._create_monitor_threads()
+        try:
+            self._create_monitor_threads()
+        except BaseException:
+            # The monitor is not closed if it fails to open
+            self._release_logging()
+            raise
         return self
 
     def __exit__(self, *_, **__) -> None:
         """Set termination trigger"""
+        try:
+            self._close()
+        finally:
+            self._release_logging()
 
-        if self._timer_process and self._timer_process.is_alive():
-            self._timer_process.join()
-
-        if self._file_monitor_thread and self._file_monitor_thread.is_alive():
-            self._file_monitor_thread.join()
+    def _close(self) -> None:
+        """Wait for all threads to finish and raise any exceptions they threw"""
+        if self._timer and self._timer.is_alive():
+            # No need to wait for the timeout if the monitor has already stopped
+            if self._monitor_termination_trigger.is_set():
+                self._timer.cancel()
+            self._timer.join()
 
-        if self._log_monitor_thread and self._log_monitor_thread.is_alive():
-            self._log_monitor_thread.join()
+        if self._monitor_thread and self._monitor_thread.is_alive():
+            self._monitor_thread.join()
 
         if _mon_thread_exc := self._exceptions.get("__main__"):
             raise _mon_thread_exc
@@ -621,5 +789,3 @@ class FileMonitor:
 
         if _exceptions:
             raise mp_exc.SessionFailure(_exceptions)
-
-        loguru.logger.remove(self._log_id)
@@ -0,0 +1,66 @@
+"""
+Multiparser Parsing Utilities
+=============================
+
+Contains helpers shared by the full file and tail parsers.
+
+"""
+
+__date__ = "2023-10-16"
+__author__ = "Kristian Zarebski"
+__maintainer__ = "Kristian Zarebski"
+__email__ = "kristian.zarebski@ukaea.uk"
+__copyright__ = "Copyright 2024, United Kingdom Atomic Energy Authority"
+
+import datetime
+import functools
+import platform
+import re
+
+# Back references and conditional groups would point at the wrong group
+# once patterns are combined
+_GROUP_REFERENCE: re.Pattern[str] = re.compile(r"\\\d|\(\?P=|\(\?\(")
+
+# The host does not change during a session so is only looked up once
+_HOSTNAME: str = platform.node()
+
+
+@functools.lru_cache(maxsize=256)
+def _format_timestamp(modified_time: float) -> str:
+    """Format a file modified time, repeated parses of an unchanged file reuse it"""
+    return datetime.datetime.fromtimestamp(modified_time).strftime(
+        "%Y-%m-%d %H:%M:%S.%f"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _combine_patterns(
+    patterns: tuple[re.Pattern[str] | str, ...],
+) -> re.Pattern[str] | None:
+    """Combine string literals and patterns into a single alternation
+
+    Returns None if the patterns cannot be safely combined, i.e. if they
+    have differing flags or refer to their own groups.
+    """
+    _compiled: list[re.Pattern[str]] = [
+        p for p in patterns if isinstance(p, re.Pattern)
+    ]
+    if len({p.flags for p in _compiled}) > 1:
+        return None
+    if any(_GROUP_REFERENCE.search(p.pattern) for p in _compiled):
+        return None
+    _flags: int = _compiled[0].flags if _compiled else 0
+
+    # Literals must still match exactly if the patterns ignore case
+    _literal_group: str = "(?-i:" if _flags & re.IGNORECASE else "(?:"
+
+    _alternatives: str = "|".join(
+        f"(?:{p.pattern})"
+        if isinstance(p, re.Pattern)
+        else f"{_literal_group}{re.escape(p)})"
+        for p in patterns
+    )
+    try:
+        return re.compile(_alternatives, _flags)
+    except re.error:
+        return None
@@ -13,41 +13,52 @@ __maintainer__ = "Kristian Zarebski"
 __email__ = "kristian.zarebski@ukaea.uk"
 __copyright__ = "Copyright 2024, United Kingdom Atomic Energy Authority"
 import csv
-import datetime
 import functools
+import importlib
 import json
 import re
 import os.path
 import pickle
-import platform
+import types
 import typing
 
-try:
-    import f90nml
-except ImportError:
-    f90nml = None  # type: ignore
-
 try:
     import flatdict
 except ImportError:
     flatdict = None  # type: ignore
 
 try:
-    import pyarrow
-except ImportError:
-    pyarrow = None  # type: ignore
-
-try:
-    import pandas
+    import orjson
 except ImportError:
-    pandas = None  # type: ignore
+    orjson = None  # type: ignore
 
 import loguru
 import toml
 import yaml
 
+from multiparser.parsing._common import (
+    _HOSTNAME,
+    _combine_patterns,
+    _format_timestamp,
+)
 from multiparser.typing import TimeStampedData
 
+# Use the LibYAML based loader where PyYAML has been built with it
+_YAML_LOADER: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_optional(name: str) -> types.ModuleType | None:
+    """Import an optional dependency when a parser first requires it
+
+    Modules such as pandas are slow to import and are only needed for
+    specific file types, so are not imported with this module.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
 
 def file_parser(parser: typing.Callable) -> typing.Callable:
     """Attach metadata to the current parser call for a file parser.
@@ -71,14 +82,14 @@ def file_parser(parser: typing.Callable) -> typing.Callable:
     def _wrapper(input_file: str, *args, **kwargs) -> TimeStampedData:
         """Full file parser decorator"""
         _data: TimeStampedData = parser(input_file, *args, **kwargs)
-        _meta_data: typing.Dict[str, str] = {
-            "timestamp": datetime.datetime.fromtimestamp(
-                os.path.getmtime(input_file)
-            ).strftime("%Y-%m-%d %H:%M:%S.%f"),
-            "hostname": platform.node(),
+        _meta_data: dict[str, str | int | list[str]] = {
+            "timestamp": _format_timestamp(os.path.getmtime(input_file)),
+            "hostname": _HOSTNAME,
             "file_name": input_file,
         }
-        return _meta_data | _data[0], _data[1]
+        # Metadata is built for this call so can be updated in place
+        _meta_data.update(_data[0])
+        return _meta_data, _data[1]
 
     _wrapper.__name__ += "__mp_parser"
 
@@ -88,25 +99,35 @@ def file_parser(parser: typing.Callable) -> typing.Callable:
 @file_parser
 def record_json(input_file: str) -> TimeStampedData:
     """Parse a JSON file"""
-    return {}, json.load(open(input_file))
+    with open(input_file, "rb") as in_f:
+        _content: bytes = in_f.read()
+    if orjson:
+        # orjson is stricter than json, rejecting values such as NaN
+        try:
+            return {}, orjson.loads(_content)
+        except orjson.JSONDecodeError:
+            pass
+    return {}, json.loads(_content)
 
 
 @file_parser
 def record_yaml(input_file: str) -> TimeStampedData:
     """Parse a YAML file"""
-    return {}, yaml.load(open(input_file), Loader=yaml.SafeLoader)
+    with open(input_file) as in_f:
+        return {}, yaml.load(in_f, Loader=_YAML_LOADER)
 
 
 @file_parser
 def record_pickle(input_file: str) -> TimeStampedData:
     """Parse a pickle file"""
-    return {}, pickle.load(open(input_file, "rb"))
+    with open(input_file, "rb") as in_f:
+        return {}, pickle.load(in_f)
 
 
 @file_parser
 def record_fortran_nml(input_file: str) -> TimeStampedData:
     """Parse a Fortran Named List"""
-    if not f90nml:
+    if not (f90nml := _import_optional("f90nml")):
         raise ImportError("Module 'f90nml' is required for Fortran named list")
     if not flatdict:
         raise ImportError("Module 'flatdict' is required for Fortran named list")
@@ -125,9 +146,9 @@ def record_csv(input_file: str) -> TimeStampedData:
 @file_parser
 def record_feather(input_file: str) -> TimeStampedData:
     """Parse a feather file"""
-    if not pyarrow:
+    if not _import_optional("pyarrow"):
         raise ImportError("Module 'pyarrow' is required for feather file type")
-    if not pandas:
+    if not (pandas := _import_optional("pandas")):
         raise ImportError("Module 'pandas' is required for feather file type")
     return {}, pandas.read_feather(input_file).to_dict()  # type: ignore
 
@@ -135,9 +156,9 @@ def record_feather(input_file: str) -> TimeStampedData:
 @file_parser
 def record_parquet(input_file: str) -> TimeStampedData:
     """Parse a parquet file"""
-    if not pyarrow:
+    if not _import_optional("pyarrow"):
         raise ImportError("Module 'pyarrow' is required for parquet file type")
-    if not pandas:
+    if not (pandas := _import_optional("pandas")):
         raise ImportError("Module 'pandas' is required for feather file type")
     return {}, pandas.read_parquet(input_file).to_dict()  # type: ignore
 
@@ -159,6 +180,14 @@ SUFFIX_PARSERS: typing.Dict[typing.Tuple[str, ...], typing.Callable] = {
     ("ft", "feather"): record_feather,
 }
 
+# Parser for each individual extension, built once so files are dispatched
+# with a single lookup rather than a search of SUFFIX_PARSERS
+_SUFFIX_DISPATCH: typing.Dict[str, typing.Callable] = {
+    extension: parser
+    for extensions, parser in SUFFIX_PARSERS.items()
+    for extension in extensions
+}
+
 
 def _full_file_parse(parse_func, in_file, tracked_values) -> TimeStampedData:
     """Apply specific parser to a file"""
@@ -179,16 +208,32 @@ def _full_file_parse(parse_func, in_file, tracked_values) -> TimeStampedData:
 
     # Filter by key through each set of values
     _out_data: typing.List[typing.Dict[str, typing.Any]] = []
+    _literals: typing.List[str] = [t for t in tracked_values if isinstance(t, str)]
+    _patterns: typing.List[re.Pattern[str]] = [
+        t for t in tracked_values if not isinstance(t, str)
+    ]
+
+    # Where possible all tracked values are combined so each key is
+    # searched only once
+    _any_tracked: re.Pattern[str] | None = _combine_patterns(tuple(tracked_values))
+
+    # Entries usually share keys, so whether a key is tracked is only
+    # determined the first time it is seen
+    _key_tracked: typing.Dict[str, bool] = {}
 
     for entry in _data:
         _out_data_entry: typing.Dict[str, typing.Any] = {}
-        for tracked_val in tracked_values or []:
-            _out_data_entry |= {
-                k: v
-                for k, v in entry.items()
-                if (isinstance(tracked_val, str) and tracked_val in k)
-                or (not isinstance(tracked_val, str) and tracked_val.findall(k))
-            }
+        for k, v in entry.items():
+            if (_tracked := _key_tracked.get(k)) is None:
+                if _any_tracked:
+                    _tracked = bool(_any_tracked.search(k))
+                else:
+                    _tracked = any(literal in k for literal in _literals) or any(
+                        pattern.search(k) for pattern in _patterns
+                    )
+                _key_tracked[k] = _tracked
+            if _tracked:
+                _out_data_entry[k] = v
         _out_data.append(_out_data_entry)
 
     return _meta, _out_data
@@ -233,11 +278,9 @@ def record_file(
 
     if parser_func:
         return _full_file_parse(parser_func, input_file, _tracked_vals)
-    else:
-        for key, parser in SUFFIX_PARSERS.items():
-            if _extension not in key:
-                continue
-            return _full_file_parse(parser, input_file, _tracked_vals)
+
+    if parser := _SUFFIX_DISPATCH.get(_extension):
+        return _full_file_parse(parser, input_file, _tracked_vals)
 
     loguru.logger.error(
         f"The file extension '{_extension}' for file '{input_file}' is not supported for 'record_file' without custom parsing"
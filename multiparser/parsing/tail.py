@@ -14,18 +14,26 @@ __email__ = "kristian.zarebski@ukaea.uk"
 __copyright__ = "Copyright 2024, United Kingdom Atomic Energy Authority"
 
 import contextlib
-import datetime
 import functools
 import os.path
-import platform
 import re
 import typing
 
 __all__ = ["record_csv", "log_parser", "record_log"]
 
+from multiparser.parsing._common import (
+    _HOSTNAME,
+    _combine_patterns,
+    _format_timestamp,
+)
 from multiparser.typing import ParserFunction, TimeStampedData
 
 
+# Strings accepted by 'int', surrounding whitespace, a sign and underscores
+# between digits being permitted
+_INTEGER: re.Pattern[str] = re.compile(r"\s*[+-]?\d+(?:_\d+)*\s*")
+
+
 def log_parser(parser: ParserFunction) -> ParserFunction:
     """Attach metadata to the current parser call for a log parser.
 
@@ -51,16 +59,18 @@ def log_parser(parser: ParserFunction) -> ParserFunction:
             raise RuntimeError("Failed to retrieve argument '__read_bytes'")
         if not (_input_file := kwargs.get("__input_file")):
             raise RuntimeError("Failed to retrieve argument '__input_file'")
-        _meta_data: dict[str, str] = {
-            "timestamp": datetime.datetime.fromtimestamp(
-                os.path.getmtime(_input_file)
-            ).strftime("%Y-%m-%d %H:%M:%S.%f"),
-            "hostname": platform.node(),
+        _meta_data: dict[str, str | int | list[str]] = {
+            "timestamp": _format_timestamp(
+                kwargs.get("__modified_time") or os.path.getmtime(_input_file)
+            ),
+            "hostname": _HOSTNAME,
             "file_name": _input_file,
             "__read_bytes": kwargs["__read_bytes"],
         }
         _meta, _data = parser(file_content, *args, **kwargs)
-        return _meta | _meta_data, _data
+        # Parsers usually return no metadata of their own, the dictionary
+        # returned by the parser is not modified as it may be reused
+        return (_meta | _meta_data if _meta else _meta_data), _data
 
     _wrapper.__name__ += "__mp_parser"
 
@@ -69,9 +79,11 @@ def log_parser(parser: ParserFunction) -> ParserFunction:
 
 def _converter(value: str) -> typing.Any:
     """Convert from string to numeric type"""
-    with contextlib.suppress(ValueError):
-        _int_val = int(value)
-        return _int_val
+    # Most values are not integers, checking the form first avoids raising
+    # and suppressing an exception for each of them
+    if _INTEGER.fullmatch(value):
+        with contextlib.suppress(ValueError):
+            return int(value)
     if value.replace(".", "", 1).isdigit():
         return float(value)
     return value
@@ -488,6 +500,16 @@ def _process_log_content(
     return {}, _out_data
 
 
+@contextlib.contextmanager
+def _open_at(file_name: str, read_bytes: int | None) -> typing.Iterator[typing.TextIO]:
+    """Open a file for reading from the given position"""
+    with open(file_name, "r") as _in_f:
+        # If the file has been truncated since the last read start again
+        if read_bytes is not None and read_bytes <= os.fstat(_in_f.fileno()).st_size:
+            _in_f.seek(read_bytes)
+        yield _in_f
+
+
 def tail_file_n_bytes(file_name: str, read_bytes: int | None) -> tuple[int, list[str]]:
     """Read lines from the end of a file.
 
@@ -502,7 +524,7 @@ def tail_file_n_bytes(file_name: str, read_bytes: int | None) -> tuple[int, list
         the path of the file to be read
     read_bytes : int, optional
         if specified, skip to this position in the file
-        before reading
+        before reading, ignored if the file is now shorter
 
     Returns
     -------
@@ -510,19 +532,24 @@ def tail_file_n_bytes(file_name: str, read_bytes: int | None) -> tuple[int, list
         * position at which read terminated
         * lines read
     """
-    with open(file_name, "r") as _in_f:
-        if read_bytes is not None:
-            _in_f.seek(read_bytes)
+    with _open_at(file_name, read_bytes) as _in_f:
         _lines = _in_f.readlines()
         return _in_f.tell(), _lines
 
 
+def _tail_file_content(file_name: str, read_bytes: int | None) -> tuple[int, str]:
+    """Read the content from the end of a file as a single block"""
+    with _open_at(file_name, read_bytes) as _in_f:
+        _content = _in_f.read()
+        return _in_f.tell(), _content
+
+
 def record_log(
     input_file: str,
     *,
     tracked_values: list[tuple[str | None, re.Pattern[str]]] | None = None,
     convert: bool = True,
-    ignore_lines: list[re.Pattern[str]] | None = None,
+    ignore_lines: list[re.Pattern[str] | str] | None = None,
     parser_func: ParserFunction | None = None,
     __read_bytes: int | None = None,
     **parser_kwargs,
@@ -542,7 +569,7 @@ def record_log(
         regular expressions defining the values to be monitored, by default None
     convert : bool, optional
         whether to convert parsed values to int, float etc, by default True
-    ignore_lines : list[Pattern], optional
+    ignore_lines : list[Pattern | str], optional
         specify patterns defining lines which should be skipped
     parser_func : typing.Callable, optional
         specify an alternative tail parsing function
@@ -557,28 +584,41 @@ def record_log(
         * metadata outlining properties such as modified time etc.
         * actual recorded data from the file.
     """
+    # Custom parsers receive a single block, if no lines are to be ignored
+    # this is read directly rather than split into lines and joined again
+    if parser_func and not ignore_lines:
+        __read_bytes, _content = _tail_file_content(input_file, __read_bytes)
+        return parser_func(
+            _content,
+            __input_file=input_file,
+            __read_bytes=__read_bytes,
+            __modified_time=os.path.getmtime(input_file),
+            convert=convert,
+            **parser_kwargs,
+        )
+
     __read_bytes, _lines = tail_file_n_bytes(input_file, __read_bytes)
 
+    # Retrieved once here rather than for every line parsed
+    _modified_time: float = os.path.getmtime(input_file)
+
     # Check if there are patterns defined for lines that should be ignored
     # if this is the case loop through all patterns for each line,
     # the patterns can either be string literals or regex compiled patterns
-    if ignore_lines:
-        _passing_lines: list[str] = []
-        for line in _lines:
-            if any(
-                [
-                    any(
-                        [
-                            isinstance(pattern, re.Pattern) and pattern.findall(line),
-                            isinstance(pattern, str) and pattern in line,
-                        ]
-                    )
-                    for pattern in ignore_lines
-                ]
-            ):
-                continue
-            _passing_lines.append(line)
-        _lines = _passing_lines
+    if ignore_lines and (_ignore := _combine_patterns(tuple(ignore_lines))):
+        _lines = [line for line in _lines if not _ignore.search(line)]
+    elif ignore_lines:
+        # Patterns are split by type once rather than checked per line
+        _literals: list[str] = [p for p in ignore_lines if isinstance(p, str)]
+        _patterns: list[re.Pattern[str]] = [
+            p for p in ignore_lines if isinstance(p, re.Pattern)
+        ]
+        _lines = [
+            line
+            for line in _lines
+            if not any(literal in line for literal in _literals)
+            and not any(pattern.search(line) for pattern in _patterns)
+        ]
 
     if parser_func:
         # In general parser functions are assumed to parse blocks of information
@@ -588,6 +628,7 @@ def record_log(
             "".join(_lines),
             __input_file=input_file,
             __read_bytes=__read_bytes,
+            __modified_time=_modified_time,
             convert=convert,
             **parser_kwargs,
         )
@@ -596,11 +637,24 @@ def record_log(
     _data: list[dict[str, typing.Any]] = []
     _metadata: dict[str, typing.Any] = {}
 
+    # A single search for any tracked value allows lines containing none
+    # of them to be skipped, metadata is the same for every line so only
+    # needs to be retrieved from the first
+    _any_tracked: re.Pattern[str] | None = (
+        _combine_patterns(tuple(value for _, value in tracked_values))
+        if tracked_values
+        else None
+    )
+
     for line in _lines:
+        if _metadata and _any_tracked and not _any_tracked.search(line):
+            _data.append({})
+            continue
         _metadata_line, _processed = _process_log_content(
             line,
             __input_file=input_file,
             __read_bytes=__read_bytes,
+            __modified_time=_modified_time,
             tracked_values=tracked_values,
             convert=convert,
         )
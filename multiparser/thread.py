@@ -15,18 +15,19 @@ __maintainer__ = "Kristian Zarebski"
 __email__ = "kristian.zarebski@ukaea.uk"
 __copyright__ = "Copyright 2024, United Kingdom Atomic Energy Authority"
 
+import contextlib
 import datetime
 import functools
-import glob
 import re
-import os.path
+import os
+import queue
 import threading
-import time
 import typing
 
 import loguru
 
 import multiparser.exceptions as mp_exc
+import multiparser.globbing as mp_glob
 import multiparser.parsing as mp_parse
 from multiparser.typing import (
     FullFileParsingCallback,
@@ -135,11 +136,11 @@ def _reparse_action(
     file_name: str,
     file_type: str | None,
     cached_metadata: dict[str, typing.Any],
-    modified_time: str,
+    modified_time: float,
     tracked_vals: list[TrackableType],
     parsing_callback: LogFileParsingCallback | FullFileParsingCallback,
     cstm_parser: ParserFunction | None,
-    lock: typing.Any | None,
+    lock: typing.ContextManager,
     monitor_callback: PerThreadCallback,
     convert: bool,
     flatten_data: bool,
@@ -159,7 +160,7 @@ def _reparse_action(
         file type if applicable
     cached_metadata : dict[str, typing.Any]
         metadata gathered during previous parse of file
-    modified_time : str
+    modified_time : float
         time stamp of last modified time
     tracked_vals : list[TrackableType]
         patterns describing data to capture
@@ -167,8 +168,8 @@ def _reparse_action(
         function to execute when parsing file, this also assembles relevant data
     cstm_parser : ParserFunction | None
         override the default parser function which retrieves data
-    lock : typing.Any | None
-        thread lock
+    lock : typing.ContextManager
+        thread lock, or a null context if callbacks are not locked
     monitor_callback : PerThreadCallback
         function executed when data is successfully extracted
     convert : bool
@@ -214,12 +215,18 @@ def _reparse_action(
         if flatten_data:
             _data = mp_parse.flatten_data(_data)
 
-        loguru.logger.debug(f"{file_name}: {modified_time}: Recorded: {_data}")
+        # Data and time stamp are only converted to strings if debug records
+        # are emitted
+        loguru.logger.opt(lazy=True).debug(
+            "{}: {}: Recorded: {}",
+            lambda: file_name,
+            lambda: datetime.datetime.fromtimestamp(modified_time).strftime(
+                "%Y-%m-%d %H:%M:%S.%f"
+            ),
+            lambda data=_data: data,
+        )
 
-        if lock:
-            with lock:
-                monitor_callback(_data, _meta)
-        else:
+        with lock:
             monitor_callback(_data, _meta)
 
     return _cached_metadata
@@ -242,7 +249,7 @@ class FileThreadLauncher(typing.Generic[CallbackType, TrackableType]):
         file_limit: int | None,
         exclude_files_globex: typing.List[str] | None,
         exception_callback: ExceptionCallback | None = None,
-        file_thread_lock: typing.Any | None = None,
+        file_thread_lock: typing.ContextManager | None = None,
         file_list: typing.List[str] | None = None,
         flatten_data: bool = False,
         abort_on_fail: bool = False,
@@ -274,7 +281,7 @@ class FileThreadLauncher(typing.Generic[CallbackType, TrackableType]):
             function to call when an exception is thrown
         file_list : typing.List[str] | None, optional
             container to append any found file names, by default None
-        file_thread_lock : threading.Lock, optional
+        file_thread_lock : typing.ContextManager, optional
             shared mutex to prevent the callback being called simultaneously by
             multiple threads.
         flatten_data : bool, optional
@@ -286,26 +293,24 @@ class FileThreadLauncher(typing.Generic[CallbackType, TrackableType]):
             throwing a dummy exception of a known form
         """
         self._trackables: TrackableList = trackables
+        self._completed_trackables: typing.Set[int] = set()
         self._exception_callback: ExceptionCallback | None = exception_callback
         self._terminate_on_file_thread_fail: bool = abort_on_fail
-        self._lock: typing.Any | None = file_thread_lock
+        self._lock: typing.ContextManager = file_thread_lock or contextlib.nullcontext()
         self._termination_trigger: threading.Event = file_thread_termination_trigger
         self._parsing_callback: CallbackType = parsing_callback
         self._notifier: MessageCallback = notification_callback
         self._file_threads: typing.Dict[str, threading.Thread] = {}
         self._exclude_globex: typing.List[str] | None = exclude_files_globex
-        self._records: typing.List[typing.Tuple[str, str]] = []
         self._interval = refresh_interval
         self._monitored_files = file_list if file_list is not None else []
         self._flatten_data = flatten_data
-        self._exceptions: typing.Dict[str, Exception | None] = {}
+        self._exception_queue: queue.SimpleQueue[tuple[str, Exception]] = (
+            queue.SimpleQueue()
+        )
         self._file_limit: int | None = file_limit
         self._exception_test: bool = test_exception_capture
 
-    @property
-    def exceptions(self) -> typing.Dict[str, Exception | None]:
-        return self._exceptions
-
     @property
     def n_running(self) -> int:
         return sum(thread.is_alive() for thread in self._file_threads.values())
@@ -344,12 +349,11 @@ class FileThreadLauncher(typing.Generic[CallbackType, TrackableType]):
         def _thread_exception_callback(
             exception: Exception,
             target_file: str = file_name,
-            exceptions: typing.Dict[str, Exception | None] = self._exceptions,
+            exception_queue: queue.SimpleQueue = self._exception_queue,
         ) -> None:
-            exceptions[target_file] = exception
+            exception_queue.put_nowait((target_file, exception))
 
         def _read_loop(
-            records: list[tuple[str, str]],
             exception_callback=_thread_exception_callback,
             monitor_callback: PerThreadCallback = callback,
             parsing_callback: CallbackType = self._parsing_callback,
@@ -368,27 +372,32 @@ class FileThreadLauncher(typing.Generic[CallbackType, TrackableType]):
 
             _cached_metadata: typing.Dict[str, str | int] = {}
 
+            # Device, inode and modified time in nanoseconds of the last parse,
+            # a replaced file is parsed again even if its modified time matches
+            _last_parsed: tuple[int, int, int] | None = None
+
             try:
                 while not termination_trigger.is_set():
-                    time.sleep(interval)
-
-                    # If the file does not exist yet then continue
-                    if not os.path.exists(file_name):
+                    # Wake early if terminated so the final read is not delayed
+                    termination_trigger.wait(interval)
+
+                    # A single stat call per cycle both checks the file
+                    # exists and retrieves its last modified time
+                    try:
+                        _stat = os.stat(file_name)
+                    except FileNotFoundError:
+                        # If the file does not exist yet then continue
                         continue
 
-                    _modified_time_stamp = os.path.getmtime(file_name)
-                    _modified_time = datetime.datetime.fromtimestamp(
-                        _modified_time_stamp
-                    ).strftime("%Y-%M-%d %H:%M:%S.%f")
-
                     # If the file has not been modified then we do not need to parse it
-                    if (_modified_time, file_name) in records:
+                    if (
+                        _modified := (_stat.st_dev, _stat.st_ino, _stat.st_mtime_ns)
+                    ) == _last_parsed:
                         continue
 
                     _cached_metadata = _reparse_action(
                         file_type=file_type,
                         file_name=file_name,
-                        records=records,
                         cstm_parser=cstm_parser,
                         monitor_callback=monitor_callback,
                         parsing_callback=parsing_callback,
@@ -398,11 +407,11 @@ class FileThreadLauncher(typing.Generic[CallbackType, TrackableType]):
                         flatten_data=flatten_data,
                         convert=convert,
                         cached_metadata=_cached_metadata,
-                        modified_time=_modified_time,
+                        modified_time=_stat.st_mtime,
                         **kwargs,
                     )
 
-                    records.append((_modified_time, file_name))
+                    _last_parsed = _modified
 
                     # If only a single read is required terminate loop
                     if static_read:
@@ -413,58 +422,93 @@ class FileThreadLauncher(typing.Generic[CallbackType, TrackableType]):
                 )
                 exception_callback(exception=e)
 
-        self._file_threads[file_name] = threading.Thread(
-            target=_read_loop,
-            args=(self._records,),
-        )
+        self._file_threads[file_name] = threading.Thread(target=_read_loop)
 
     @handle_monitor_thread_exception
-    def run(self) -> None:
-        """Start the thread launcher"""
+    def start(self) -> bool:
+        """Prepare the thread launcher before the first refresh
+
+        Returns
+        -------
+        bool
+            whether the launcher is ready to be refreshed
+        """
         if self._exception_test:
             raise AssertionError("TESTING_MODE: Test AssertionError")
+        return True
 
-        while not self._termination_trigger.is_set():
-            if any(self.exceptions.values()) and self._terminate_on_file_thread_fail:
-                break
-
-            time.sleep(self._interval)
-            _excludes: typing.List[str] = []
-            for expr in self._exclude_globex or []:
-                _excludes += glob.glob(expr)
-            for trackable in self._trackables:
-                # Check for multiple tracking entries for the same file
-                # not allowed due to constraint of one thread spawned per file
-                _registered_files: typing.List[str] = []
-                if not isinstance((_glob_str := trackable["glob_expr"]), str):
-                    raise AssertionError(
-                        f"Expected type AnyStr for globular expression but got '{_glob_str}'"
-                    )
-                for file in glob.glob(_glob_str):
-                    if file in _registered_files:
-                        raise AssertionError(
-                            "Conflicting globular expressions. "
-                            f"File '{file}' cannot be tracked above once."
-                        )
-                    if file not in self._file_threads and file not in _excludes:
-                        if self._file_limit and self.n_running >= self._file_limit:
-                            loguru.logger.warning(
-                                f"Reached file limit, cannot parse '{file}'"
-                            )
-                            continue
-
-                        self._notifier(file)
-                        self._monitored_files.append(file)
-                        self._exceptions[file] = None
-                        self._append_thread(file, self._flatten_data, **trackable)
-                        self._file_threads[file].start()
-                        _registered_files.append(file)
-        self._raise_exceptions()
+    @handle_monitor_thread_exception
+    def tick(self, listings: mp_glob.DirectoryListings) -> bool:
+        """Launch threads for any newly found files
+
+        Parameters
+        ----------
+        listings : mp_glob.DirectoryListings
+            directory contents already read, shared between trackables
+            and launchers
+
+        Returns
+        -------
+        bool
+            whether the launcher should continue to be refreshed
+        """
+        if not self._exception_queue.empty() and self._terminate_on_file_thread_fail:
+            return False
+
+        _excludes: re.Pattern[str] | None = mp_glob.compile_glob_union(
+            tuple(self._exclude_globex or ())
+        )
+        # Trackables may be added while the launcher is running, a snapshot is
+        # taken so that each refresh works from a consistent set
+        _trackables: list[tuple[int, typing.Any]] = [
+            (i, trackable)
+            for i, trackable in enumerate(self._trackables[:])
+            if i not in self._completed_trackables
+        ]
+
+        _glob_exprs: list[str] = []
+        for _, trackable in _trackables:
+            if not isinstance((_glob_str := trackable["glob_expr"]), str):
+                raise AssertionError(
+                    f"Expected type AnyStr for globular expression but got '{_glob_str}'"
+                )
+            _glob_exprs.append(_glob_str)
+
+        # Each file is matched once, against the earliest expression matching
+        # it, as only one thread can be spawned per file
+        for file, index in mp_glob.match_globs(_glob_exprs, listings):
+            if file not in self._file_threads and not (
+                _excludes and _excludes.match(file)
+            ):
+                if self._file_limit and self.n_running >= self._file_limit:
+                    loguru.logger.warning(f"Reached file limit, cannot parse '{file}'")
+                    continue
+
+                self._notifier(file)
+                self._monitored_files.append(file)
+                _position, _trackable = _trackables[index]
+                self._append_thread(file, self._flatten_data, **_trackable)
+                self._file_threads[file].start()
+
+                # Static literal paths can match no other file once launched
+                if _trackable.get("static") and not mp_glob.has_magic(
+                    _glob_exprs[index]
+                ):
+                    self._completed_trackables.add(_position)
+        return True
+
+    def run(self) -> None:
+        """Start the thread launcher"""
+        run_launchers([self], self._termination_trigger, self._interval)
 
     def abort_threads(self) -> None:
         for thread in self._file_threads.values():
             thread.join()
 
+    def finish(self) -> None:
+        """Called once the launcher is no longer being refreshed"""
+        self._raise_exceptions()
+
     def _raise_exceptions(self) -> None:
         """Raise an exception summarising exception throws in all threads.
 
@@ -481,15 +525,62 @@ class FileThreadLauncher(typing.Generic[CallbackType, TrackableType]):
         if self._terminate_on_file_thread_fail:
             self.abort_threads()
 
-        if not any(self._exceptions.values()):
+        if self._exception_queue.empty():
             return
 
         if self._exception_callback:
             self._exception_callback(
-                mp_exc.FileMonitorThreadException(self._exceptions)
+                mp_exc.FileMonitorThreadException.drain(self._exception_queue)
             )
 
 
+def run_launchers(
+    launchers: typing.Sequence[FileThreadLauncher],
+    termination_trigger: threading.Event,
+    interval: float,
+) -> None:
+    """Refresh one or more thread launchers from the calling thread.
+
+    All launchers are refreshed together each interval, sharing any
+    directory contents read, until terminated or none remain active.
+    Directories are only read again once they have been modified.
+
+    Parameters
+    ----------
+    launchers : typing.Sequence[FileThreadLauncher]
+        the thread launchers to refresh
+    termination_trigger : threading.Event
+        event which when set stops the refresh loop
+    interval : float
+        time between refreshes
+    """
+    _active: list[FileThreadLauncher] = [
+        launcher for launcher in launchers if launcher.start()
+    ]
+
+    _listings = mp_glob.DirectoryListings()
+
+    _finished: list[FileThreadLauncher] = []
+
+    while _active and not termination_trigger.is_set():
+        termination_trigger.wait(interval)
+        _listings.refresh()
+        _still_active: list[FileThreadLauncher] = []
+        for launcher in _active:
+            if launcher.tick(_listings):
+                _still_active.append(launcher)
+                continue
+            # Failures are reported as soon as a launcher stops, so that any
+            # abort is not delayed until all other launchers have stopped
+            launcher.finish()
+            _finished.append(launcher)
+        _active = _still_active
+
+    for launcher in launchers:
+        if launcher not in _finished:
+            launcher.finish()
+
+
 class LogFileThreadLauncher(
     FileThreadLauncher[LogFileParsingCallback, tuple[str | None, re.Pattern[str]]]
 ):
@@ -509,7 +600,7 @@ class LogFileThreadLauncher(
         exception_callback: typing.Callable | None = None,
         notification_callback: typing.Callable | None = None,
         file_list: typing.List[str] | None = None,
-        file_thread_lock: typing.Any | None = None,
+        file_thread_lock: typing.ContextManager | None = None,
         flatten_data: bool = False,
         abort_on_fail: bool = False,
         test_exception_capture: bool = False,
@@ -539,7 +630,7 @@ class LogFileThreadLauncher(
             Default is a print statement.
         file_list : typing.List[str] | None, optional
             container to append any found file names, by default None
-        file_thread_lock : threading.Lock, optional
+        file_thread_lock : typing.ContextManager, optional
             shared mutex to prevent the callback being called simultaneously by
             multiple threads.
         flatten_data : bool, optional
@@ -588,7 +679,7 @@ class FullFileThreadLauncher(
         exception_callback: typing.Callable | None = None,
         notification_callback: typing.Callable | None = None,
         file_list: typing.List[str] | None = None,
-        file_thread_lock: "threading.Lock | None" = None,
+        file_thread_lock: typing.ContextManager | None = None,
         flatten_data: bool = False,
         abort_on_fail: bool = False,
         test_exception_capture: bool = False,
@@ -619,7 +710,7 @@ class FullFileThreadLauncher(
             Default is a print statement.
         file_list : typing.List[str] | None, optional
             container to append any found file names, by default None
-        file_thread_lock : threading.Lock, optional
+        file_thread_lock : typing.ContextManager, optional
             shared mutex to prevent the callback being called simultaneously by
             multiple threads.
         flatten_data : bool, optional
@@ -14,13 +14,16 @@ from multiparser.parsing.file import (
     record_csv as file_record_csv,
     record_fortran_nml,
     record_feather,
+    record_json,
     record_toml,
 )
 from multiparser.parsing.tail import (
     record_with_delimiter,
     tail_file_n_bytes,
     record_csv as log_record_csv,
+    record_log,
     _extract_label_value_pair,
+    _converter,
 )
 
 DATA_LIBRARY: str = os.path.join(os.path.dirname(__file__), "data")
@@ -70,6 +73,19 @@ def test_parse_toml() -> None:
         assert list(sorted(_data.items())) == sorted(_data2.items())
 
 
+@pytest.mark.parsing
+def test_parse_json_non_finite() -> None:
+    with tempfile.TemporaryDirectory() as temp_d:
+        _data_file = os.path.join(temp_d, "data.json")
+        with open(_data_file, "w") as out_f:
+            out_f.write('{"a": NaN, "b": Infinity, "c": 1}')
+        _meta, _data = record_json(input_file=_data_file)
+        assert "timestamp" in _meta
+        assert _data["a"] != _data["a"]
+        assert _data["b"] == float("inf")
+        assert _data["c"] == 1
+
+
 @pytest.mark.parsing
 def test_unrecognised_file_type() -> None:
     with tempfile.NamedTemporaryFile(suffix=".npy") as temp_f:
@@ -96,6 +112,20 @@ def test_file_block_read() -> None:
         assert _lines[-1] == f"{string.ascii_lowercase}\n"
 
 
+@pytest.mark.parsing
+def test_file_block_read_truncated() -> None:
+    """Test that a file truncated since the last read is read from the start"""
+    with tempfile.NamedTemporaryFile(suffix=".log") as temp_f:
+        with open(temp_f.name, "w") as out_f:
+            for _ in range(8):
+                out_f.write(f"{string.ascii_uppercase}\n")
+        _bytes, _ = tail_file_n_bytes(temp_f.name, None)
+        with open(temp_f.name, "w") as out_f:
+            out_f.write(f"{string.ascii_lowercase}\n")
+        _, _lines = tail_file_n_bytes(temp_f.name, _bytes)
+        assert _lines == [f"{string.ascii_lowercase}\n"]
+
+
 @pytest.mark.parsing
 @pytest.mark.parametrize(
     "fake_log",
@@ -241,3 +271,44 @@ def test_label_value_extraction(regex_result: tuple, label: str | None) -> None:
             tracked_val=re.compile("undefined"),
             type_descriptor="NoType",
         )
+
+
+@pytest.mark.parsing
+@pytest.mark.parametrize(
+    "ignore_lines",
+    (
+        ["abc", re.compile(r"\d+x")],
+        [re.compile("ABC", re.IGNORECASE), re.compile(r"\d+x")],
+        [re.compile(r"(a)b\1"), re.compile(r"(\d)\1x")],
+        [re.compile(r"(a)bc"), re.compile(r"(\d)?(?(1)1x|aba)")],
+        ["KEEP", re.compile(r"ABC|\d+X|aba", re.IGNORECASE)],
+    ),
+    ids=(
+        "combined",
+        "mixed_flags",
+        "back_references",
+        "conditional_groups",
+        "case_sensitive_literal",
+    ),
+)
+def test_log_ignore_lines(ignore_lines: list[re.Pattern[str] | str]) -> None:
+    with tempfile.TemporaryDirectory() as temp_d:
+        _log_file = os.path.join(temp_d, "ignore.log")
+        with open(_log_file, "w") as out_f:
+            out_f.write("keep 1\nskip abc\n11x keep 3\naba skip\nkeep 2\n")
+        _, _data = record_log(
+            _log_file,
+            tracked_values=[("keep", re.compile(r"keep (\d)"))],
+            ignore_lines=ignore_lines,
+        )
+    assert [d for d in _data if d] == [{"keep": 1}, {"keep": 2}]
+
+
+@pytest.mark.parsing
+@pytest.mark.parametrize(
+    "value,expected",
+    [("12", 12), (" -3 ", -3), ("1_000", 1000), ("1.5", 1.5), ("-1.5", "-1.5"), ("1e5", "1e5"), ("abc", "abc")],
+)
+def test_converter(value: str, expected: typing.Any) -> None:
+    _result = _converter(value)
+    assert _result == expected and type(_result) is type(expected)
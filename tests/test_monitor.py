@@ -1,9 +1,13 @@
+import glob
+import io
 import json
 import logging
 import os
+import pathlib
 import random
 import re
 import tempfile
+import threading
 import time
 import typing
 import dataclasses
@@ -18,6 +22,8 @@ from conftest import fake_csv, fake_nml, fake_toml, to_nml
 
 import multiparser
 import multiparser.exceptions as mp_exc
+import multiparser.globbing as mp_glob
+import multiparser.monitor as mp_monitor
 import multiparser.thread as mp_thread
 import multiparser.parsing as mp_parse
 from tests.conftest import fake_feather, fake_json, fake_parquet, fake_pickle, fake_yaml
@@ -155,6 +161,32 @@ def test_run_on_directory_all(
             
 
 
+@pytest.mark.monitor
+def test_terminate_all_on_fail_stops_session() -> None:
+    @mp_parse.file_parser
+    def _parser_func(*_, **__):
+        raise RuntimeError("Failed to parse file")
+
+    _timeout: int = 6
+    with tempfile.TemporaryDirectory() as temp_d:
+        pathlib.Path(os.path.join(temp_d, "test.tst")).touch()
+        _start: float = time.time()
+        with pytest.raises(mp_exc.SessionFailure):
+            with multiparser.FileMonitor(
+                lambda *_: None,
+                interval=0.1,
+                timeout=_timeout,
+                terminate_all_on_fail=True,
+            ) as monitor:
+                monitor.track(
+                    path_glob_exprs=os.path.join(temp_d, "*.tst"),
+                    parser_func=_parser_func,
+                )
+                monitor.run()
+        # The session must be aborted by the failure rather than the timeout
+        assert time.time() - _start < _timeout / 2
+
+
 @pytest.mark.monitor
 def test_run_on_directory_filtered() -> None:
     _interval: float = 0.1
@@ -603,4 +635,257 @@ def test_custom_log_parser(parser: str) -> None:
                 path_glob_exprs=["files*"],
                 parser_func=_bad_raises_custom_log_parser
             )
-            assert "Custom parser testing failed with exception" in str(e.value)
\ No newline at end of file
+            assert "Custom parser testing failed with exception" in str(e.value)
+
+@pytest.mark.monitor
+@pytest.mark.parametrize(
+    "expression",
+    ("*.toml", "sub/*", "*/*.toml", "x[!2].txt", "ab?.log", ".*", "[ab]*")
+)
+def test_glob_union_matches_glob(expression: str) -> None:
+    with tempfile.TemporaryDirectory() as temp_d:
+        _files = ["a.toml", "b.csv", ".h.toml", "sub/c.toml", "x1.txt", "abc.log"]
+        for file_name in _files:
+            _path = os.path.join(temp_d, file_name)
+            os.makedirs(os.path.dirname(_path), exist_ok=True)
+            pathlib.Path(_path).touch()
+        _expression = os.path.join(temp_d, expression)
+        _pattern = mp_glob.compile_glob_union((_expression,))
+        _matched = {
+            os.path.join(temp_d, f) for f in _files
+            if _pattern.match(os.path.join(temp_d, f))
+        }
+        assert _matched == set(glob.glob(_expression))
+
+
+@pytest.mark.monitor
+@pytest.mark.parametrize(
+    "expression,valid",
+    (("*.toml", True), ("sub/[!a]?.txt", True), (10, False), (None, False)),
+    ids=("wildcard", "set", "int", "none")
+)
+def test_validate_glob(expression, valid: bool) -> None:
+    if valid:
+        mp_glob.validate_glob(expression)
+    else:
+        with pytest.raises(AssertionError):
+            mp_glob.validate_glob(expression)
+
+
+@pytest.mark.monitor
+@pytest.mark.parametrize(
+    "expression",
+    (
+        "*.toml", "sub/*", "*/*.toml", "x[!2].txt", "ab?.log", ".*", "[ab]*",
+        "a.toml", "s*/c.toml", "*/*", "sub/c.toml"
+    )
+)
+def test_match_globs_matches_glob(expression: str) -> None:
+    with tempfile.TemporaryDirectory() as temp_d:
+        _files = ["a.toml", "b.csv", ".h.toml", "sub/c.toml", "x1.txt", "abc.log"]
+        for file_name in _files:
+            _path = os.path.join(temp_d, file_name)
+            os.makedirs(os.path.dirname(_path), exist_ok=True)
+            pathlib.Path(_path).touch()
+        _expression = os.path.join(temp_d, expression)
+        _listings = mp_glob.DirectoryListings()
+        _matches = dict(mp_glob.match_globs([_expression], _listings))
+        assert set(_matches) == set(glob.glob(_expression))
+        assert set(_matches.values()) <= {0}
+
+
+@pytest.mark.monitor
+def test_directory_listings_refresh() -> None:
+    with tempfile.TemporaryDirectory() as temp_d:
+        _listings = mp_glob.DirectoryListings()
+        pathlib.Path(os.path.join(temp_d, "a.log")).touch()
+        assert _listings.names(temp_d) == ["a.log"]
+        pathlib.Path(os.path.join(temp_d, "b.log")).touch()
+        assert _listings.names(temp_d) == ["a.log"]
+        _listings.refresh()
+        assert sorted(_listings.names(temp_d)) == ["a.log", "b.log"]
+        assert _listings.names(os.path.join(temp_d, "missing")) == []
+
+
+@pytest.mark.monitor
+def test_match_globs_earliest_expression() -> None:
+    with tempfile.TemporaryDirectory() as temp_d:
+        for file_name in ["a.toml", "b.csv", "c.toml"]:
+            pathlib.Path(os.path.join(temp_d, file_name)).touch()
+        _expressions = [
+            os.path.join(temp_d, "a.*"),
+            os.path.join(temp_d, "*.toml"),
+            os.path.join(temp_d, "*.csv"),
+        ]
+        _matches = dict(mp_glob.match_globs(_expressions, mp_glob.DirectoryListings()))
+        assert _matches == {
+            os.path.join(temp_d, "a.toml"): 0,
+            os.path.join(temp_d, "c.toml"): 1,
+            os.path.join(temp_d, "b.csv"): 2,
+        }
+
+
+@pytest.mark.monitor
+def test_match_globs_earliest_expression_mixed() -> None:
+    with tempfile.TemporaryDirectory() as temp_d:
+        os.makedirs(os.path.join(temp_d, "out"))
+        pathlib.Path(os.path.join(temp_d, "out", "a.json")).touch()
+        _expressions = [
+            os.path.join(temp_d, "o*", "a.json"),
+            os.path.join(temp_d, "out", "*.json"),
+        ]
+        _listings = mp_glob.DirectoryListings()
+        _matches = list(mp_glob.match_globs(_expressions, _listings))
+        assert _matches == [(os.path.join(temp_d, "out", "a.json"), 0)]
+        _matches = list(mp_glob.match_globs(_expressions[::-1], _listings))
+        assert _matches == [(os.path.join(temp_d, "out", "a.json"), 0)]
+
+
+def _session_failure() -> mp_exc.SessionFailure:
+    _exceptions: dict[str, BaseException] = {}
+    for file_name in ("a.log", "b.csv"):
+        try:
+            raise RuntimeError(f"Failed to parse '{file_name}'")
+        except RuntimeError as e:
+            _exceptions[file_name] = e
+    return mp_exc.SessionFailure(_exceptions)
+
+
+@pytest.mark.monitor
+@pytest.mark.parametrize("verbose", ("1", "0", None), ids=("verbose", "brief", "default"))
+def test_session_failure_message(monkeypatch, verbose: str | None) -> None:
+    if verbose is None:
+        monkeypatch.delenv("MULTIPARSER_VERBOSE_EXCEPTIONS", raising=False)
+    else:
+        monkeypatch.setenv("MULTIPARSER_VERBOSE_EXCEPTIONS", verbose)
+    _failure = _session_failure()
+    assert _failure.args[0] is _failure.exceptions
+    assert "Traceback" in _failure.format_full()
+    assert "Failed to parse 'b.csv'" in _failure.format_full()
+    if verbose == "0":
+        assert str(_failure) == (
+            "Multiparser session encountered 2 exceptions from: a.log, b.csv"
+        )
+    else:
+        assert str(_failure) == _failure.format_full()
+
+
+@pytest.mark.monitor
+def test_session_failure_traceback_cache(
+    monkeypatch, mocker: pytest_mock.MockerFixture
+) -> None:
+    monkeypatch.setenv("MULTIPARSER_VERBOSE_EXCEPTIONS", "1")
+    _failure = _session_failure()
+    _format = mocker.spy(mp_exc.traceback, "format_exception")
+    _message: str = _failure.format_full()
+    assert _format.call_count == 2
+    assert _failure.format_full() == _message
+    assert str(_failure) == _message
+    assert _format.call_count == 2
+
+
+@pytest.mark.monitor
+def test_buffered_stream_single_flusher() -> None:
+    _output = io.StringIO()
+    _stream = mp_monitor._BufferedStream(_output, flush_interval=0.05)
+    _existing: set[threading.Thread] = set(threading.enumerate())
+    _started: set[threading.Thread] = set()
+    for i in range(20):
+        _stream.write(f"message {i}\n")
+        time.sleep(0.025)
+        _started.update(set(threading.enumerate()) - _existing)
+    # Messages are written out by the same thread throughout
+    assert _started == {_stream._flusher}
+    _stream.stop()
+    assert not _stream._flusher.is_alive()
+    assert _output.getvalue() == "".join(f"message {i}\n" for i in range(20))
+
+
+@pytest.mark.monitor
+def test_monitors_share_log_handler() -> None:
+    _monitor_1 = multiparser.FileMonitor(plain_logging=True, log_level="INFO")
+    _monitor_2 = multiparser.FileMonitor(plain_logging=True, log_level="INFO")
+    assert _monitor_1._log_handler == _monitor_2._log_handler
+    assert mp_monitor._LOG_HANDLERS[_monitor_1._log_handler][1] == 2
+    mp_monitor._release_log_handler(_monitor_1._log_handler)
+    mp_monitor._release_log_handler(_monitor_2._log_handler)
+    assert _monitor_1._log_handler not in mp_monitor._LOG_HANDLERS
+
+
+@pytest.mark.monitor
+def test_log_handler_level_name_and_number() -> None:
+    _monitor_1 = multiparser.FileMonitor(plain_logging=True, log_level="DEBUG")
+    _monitor_2 = multiparser.FileMonitor(plain_logging=True, log_level=logging.DEBUG)
+    assert _monitor_1._log_handler == _monitor_2._log_handler
+    _monitor_1._release_logging()
+    _monitor_2._release_logging()
+    assert (True, logging.DEBUG) not in mp_monitor._LOG_HANDLERS
+    assert (False, logging.DEBUG) not in mp_monitor._LOG_HANDLERS
+
+
+@pytest.mark.monitor
+def test_log_handler_released_on_failure() -> None:
+    _handlers = {k: v[1] for k, v in mp_monitor._LOG_HANDLERS.items()}
+    with pytest.raises(RuntimeError):
+        with multiparser.FileMonitor(
+            plain_logging=True, log_level="WARNING", timeout=1
+        ) as monitor:
+            monitor.run()
+            raise RuntimeError("Failure within monitor context")
+    assert monitor._log_handler is None
+    assert {k: v[1] for k, v in mp_monitor._LOG_HANDLERS.items()} == _handlers
+
+
+@pytest.mark.monitor
+def test_track_after_run() -> None:
+    _parsed: list[str] = []
+    with tempfile.TemporaryDirectory() as temp_d:
+        for name in ("first.json", "second.json"):
+            with open(os.path.join(temp_d, name), "w") as out_f:
+                json.dump({"value": 1}, out_f)
+
+        with multiparser.FileMonitor(
+            lambda _, meta: _parsed.append(os.path.basename(meta["file_name"])),
+            interval=0.1,
+        ) as monitor:
+            monitor.track(
+                path_glob_exprs=os.path.join(temp_d, "first.json"), static=True
+            )
+            monitor.run()
+            time.sleep(0.5)
+            monitor.track(
+                path_glob_exprs=os.path.join(temp_d, "second.json"), static=True
+            )
+            time.sleep(0.5)
+            monitor.terminate()
+    assert sorted(_parsed) == ["first.json", "second.json"]
+
+
+@pytest.mark.monitor
+def test_directory_listings_matches() -> None:
+    with tempfile.TemporaryDirectory() as temp_d:
+        _listings = mp_glob.DirectoryListings()
+        _pattern = re.compile(r"\w+\.log\Z")
+        pathlib.Path(os.path.join(temp_d, "a.log")).touch()
+        pathlib.Path(os.path.join(temp_d, "b.txt")).touch()
+        _matches = _listings.matches(temp_d, _pattern)
+        assert [m.string for m in _matches] == ["a.log"]
+        assert _listings.matches(temp_d, _pattern) is _matches
+        pathlib.Path(os.path.join(temp_d, "c.log")).touch()
+        _listings.refresh()
+        assert sorted(m.string for m in _listings.matches(temp_d, _pattern)) == ["a.log", "c.log"]
+
+
+@pytest.mark.monitor
+def test_directory_listings_matches_evicted() -> None:
+    with tempfile.TemporaryDirectory() as temp_d:
+        _listings = mp_glob.DirectoryListings()
+        pathlib.Path(os.path.join(temp_d, "a.log")).touch()
+        for i in range(10):
+            _listings.refresh()
+            _listings.matches(temp_d, re.compile(rf"a\.log|{i}\Z"))
+            _listings.matches(temp_d, re.compile(r"\w+\.log\Z"))
+        # Only matches for patterns used since the last refresh are held
+        _listings.refresh()
+        assert len(_listings._previous_matches) == 2
+        assert not _listings._matches